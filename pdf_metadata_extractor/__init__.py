@@ -1,6 +1,13 @@
 """PDF Metadata Extractor with Llama."""
 
 from .models import FileProperties, LLMMetadata, LLMStats, PDFMetadata
-from .extractor import extract_metadata
+from .extractor import extract_metadata, extract_metadata_batch
 
-__all__ = ["FileProperties", "LLMMetadata", "LLMStats", "PDFMetadata", "extract_metadata"]
+__all__ = [
+    "FileProperties",
+    "LLMMetadata",
+    "LLMStats",
+    "PDFMetadata",
+    "extract_metadata",
+    "extract_metadata_batch",
+]
@@ -1,11 +1,16 @@
 """CLI entry point using argparse."""
 
 import argparse
-import json
+import asyncio
+import os
 import sys
+import textwrap
 from pathlib import Path
 
-from .extractor import extract_metadata
+import orjson
+
+from .extractor import extract_metadata, extract_metadata_batch
+from .llm_client import DEFAULT_CACHE_DIR, DEFAULT_MAX_TOKENS, warmup_model
 from .models import PDFMetadata
 
 
@@ -42,8 +47,7 @@ def format_text_output(metadata: PDFMetadata) -> str:
         lines.append(f"  Category:     {llm.category}")
         lines.append(f"  Keywords:     {', '.join(llm.keywords)}")
         lines.append(f"\n  Summary:")
-        for line in wrap_text(llm.summary, width=45, indent="    "):
-            lines.append(line)
+        lines.extend("    " + line for line in textwrap.wrap(llm.summary, width=45))
 
     # File properties
     lines.append("\n[File Properties]")
@@ -84,26 +88,56 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
-def wrap_text(text: str, width: int = 70, indent: str = "") -> list[str]:
-    """Wrap text to specified width."""
-    words = text.split()
-    lines = []
-    current_line = indent
-
-    for word in words:
-        if len(current_line) + len(word) + 1 <= width + len(indent):
-            if current_line == indent:
-                current_line += word
-            else:
-                current_line += " " + word
-        else:
-            lines.append(current_line)
-            current_line = indent + word
+def _default_concurrency() -> int:
+    """Default batch concurrency: match the Ollama server's OLLAMA_NUM_PARALLEL if set."""
+    try:
+        return max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")))
+    except ValueError:
+        return 4
+
+
+def _format_error(error: Exception) -> str:
+    """Format an exception for an error message, naming unexpected error types."""
+    if isinstance(error, (FileNotFoundError, ValueError, ConnectionError)):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+async def run_batch(args: argparse.Namespace) -> int:
+    """Process several PDF files concurrently, printing results as they complete.
+
+    Returns:
+        Process exit code (1 if any file failed, 0 otherwise).
+    """
+    exit_code = 0
+    results = extract_metadata_batch(
+        args.file,
+        use_llm=not args.no_llm,
+        model=args.model,
+        language=args.language,
+        concurrency=args.concurrency,
+        debug=args.debug,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        max_tokens=args.max_tokens or None,
+        pdf_workers=args.pdf_workers,
+    )
+
+    async for pdf_path, result in results:
+        if isinstance(result, Exception):
+            print(f"Error: {pdf_path}: {_format_error(result)}", file=sys.stderr)
+            exit_code = 1
+            continue
 
-    if current_line.strip():
-        lines.append(current_line)
+        if args.output == "json":
+            # One JSON object per line (JSON Lines) so output can be streamed
+            # (mode="json" keeps Pydantic's datetime format, e.g. "Z" for UTC)
+            record = {"path": str(pdf_path), "metadata": result.model_dump(mode="json")}
+            print(orjson.dumps(record).decode(), flush=True)
+        else:
+            print(f"File: {pdf_path}")
+            print(format_text_output(result), flush=True)
 
-    return lines
+    return exit_code
 
 
 def main() -> None:
@@ -116,7 +150,8 @@ def main() -> None:
     parser.add_argument(
         "file",
         type=Path,
-        help="Path to the PDF file",
+        nargs="+",
+        help="Path to the PDF file (several files are processed concurrently)",
     )
 
     parser.add_argument(
@@ -141,12 +176,58 @@ def main() -> None:
         help="Output language for all extracted fields (e.g., English, Japanese). Default: auto-detect from PDF",
     )
 
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=DEFAULT_MAX_TOKENS,
+        help="Approximate token budget for the document text sent to the LLM; "
+        f"0 = no limit (default: {DEFAULT_MAX_TOKENS})",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        default=_default_concurrency(),
+        help="Number of files processed concurrently when several files are given "
+        "(default: $OLLAMA_NUM_PARALLEL or 4)",
+    )
+
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=1,
+        help="Number of processes for extracting text from long PDFs (default: 1). "
+        "The processes are started once per run, which takes about a second, so this "
+        "only pays off for PDFs whose text does not fill the character limit within "
+        "a few pages",
+    )
+
     parser.add_argument(
         "--no-llm",
         action="store_true",
         help="Skip LLM extraction (only show file properties)",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached LLM responses (default: {DEFAULT_CACHE_DIR})",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM, ignoring and not updating the response cache",
+    )
+
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Load the model and prefill the shared prompt prefix before extraction",
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -155,21 +236,50 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    # Validate file exists
-    if not args.file.exists():
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
-
-    if not args.file.suffix.lower() == ".pdf":
-        print(f"Warning: File may not be a PDF: {args.file}", file=sys.stderr)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.pdf_workers < 1:
+        parser.error("--pdf-workers must be at least 1")
+    if args.max_tokens < 0:
+        parser.error("--max-tokens must not be negative")
+
+    # Validate files exist
+    for pdf_file in args.file:
+        if not pdf_file.exists():
+            print(f"Error: File not found: {pdf_file}", file=sys.stderr)
+            sys.exit(1)
+
+        if not pdf_file.suffix.lower() == ".pdf":
+            print(f"Warning: File may not be a PDF: {pdf_file}", file=sys.stderr)
+
+    if args.warmup and not args.no_llm:
+        try:
+            warmup_model(args.model, language=args.language, debug=args.debug)
+        except ConnectionError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if len(args.file) > 1:
+        try:
+            exit_code = asyncio.run(run_batch(args))
+        except KeyboardInterrupt:
+            print("\nInterrupted", file=sys.stderr)
+            sys.exit(130)
+        except Exception as e:
+            print(f"Error: {_format_error(e)}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(exit_code)
 
     try:
         metadata = extract_metadata(
-            pdf_path=args.file,
+            pdf_path=args.file[0],
             use_llm=not args.no_llm,
             model=args.model,
             language=args.language,
             debug=args.debug,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            max_tokens=args.max_tokens or None,
+            pdf_workers=args.pdf_workers,
         )
 
         if args.output == "json":
@@ -1,10 +1,31 @@
 """Main extraction orchestration."""
 
+import asyncio
+import sys
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from .models import PDFMetadata
-from .pdf_parser import extract_file_properties, extract_text
-from .llm_client import extract_llm_metadata
+import ollama
+import orjson
+
+from .models import FileProperties, PDFMetadata
+from .pdf_parser import extract_all
+from .llm_client import DEFAULT_MAX_TOKENS, aextract_llm_metadata, async_client, extract_llm_metadata
+
+
+def _extract_pdf(
+    pdf_path: Path, use_llm: bool, pdf_workers: int, debug: bool,
+) -> tuple[FileProperties, str | None]:
+    """Extract file properties and, if needed, the text to send to the LLM."""
+    file_properties, text = extract_all(pdf_path, need_text=use_llm, workers=pdf_workers)
+
+    if debug:
+        print(f"[DEBUG] File properties: {orjson.dumps(file_properties, option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z).decode()}", file=sys.stderr)
+        if text is not None:
+            print(f"\n[DEBUG] Extracted text length: {len(text)} chars", file=sys.stderr)
+
+    return file_properties, text
 
 
 def extract_metadata(
@@ -13,6 +34,9 @@ def extract_metadata(
     model: str = "llama3.2",
     language: str | None = None,
     debug: bool = False,
+    cache_dir: str | Path | None = None,
+    max_tokens: int | None = DEFAULT_MAX_TOKENS,
+    pdf_workers: int = 1,
 ) -> PDFMetadata:
     """Extract metadata from a PDF file.
 
@@ -22,6 +46,10 @@ def extract_metadata(
         model: Ollama model name to use for LLM extraction.
         language: Output language for all extracted fields (None = auto-detect).
         debug: Whether to print debug information to stderr.
+        cache_dir: Directory for cached LLM responses (None = no caching).
+        max_tokens: Approximate token budget for the text sent to the LLM
+            (None = no limit).
+        pdf_workers: Number of processes for extracting text from long PDFs.
 
     Returns:
         PDFMetadata object containing all extracted metadata.
@@ -33,24 +61,93 @@ def extract_metadata(
     """
     pdf_path = Path(pdf_path)
 
-    # Extract physical file properties
-    file_properties = extract_file_properties(pdf_path)
-
-    if debug:
-        import sys
-        print(f"[DEBUG] File properties: {file_properties.model_dump_json(indent=2)}", file=sys.stderr)
+    file_properties, text = _extract_pdf(pdf_path, use_llm, pdf_workers, debug)
 
     # Extract LLM metadata if requested
     llm_metadata = None
-    if use_llm:
-        text = extract_text(pdf_path)
-        if debug:
-            import sys
-            print(f"\n[DEBUG] Extracted text length: {len(text)} chars", file=sys.stderr)
-        if text.strip():
-            llm_metadata = extract_llm_metadata(text, model=model, language=language, debug=debug)
+    if text and text.strip():
+        llm_metadata = extract_llm_metadata(
+            text, model=model, language=language, debug=debug,
+            cache_dir=cache_dir, max_tokens=max_tokens,
+        )
 
     return PDFMetadata(
         file=file_properties,
         llm=llm_metadata,
     )
+
+
+async def extract_metadata_batch(
+    pdf_paths: Iterable[str | Path],
+    use_llm: bool = True,
+    model: str = "llama3.2",
+    language: str | None = None,
+    concurrency: int = 4,
+    debug: bool = False,
+    cache_dir: str | Path | None = None,
+    max_tokens: int | None = DEFAULT_MAX_TOKENS,
+    pdf_workers: int = 1,
+) -> AsyncIterator[tuple[Path, PDFMetadata | Exception]]:
+    """Extract metadata from many PDF files with concurrent LLM requests.
+
+    PDF parsing runs off the event loop in a single worker thread (PyMuPDF
+    does not support multithreading, so files are parsed one at a time) and up
+    to ``concurrency`` LLM requests are sent to Ollama at once. The server only
+    decodes them in parallel if it was started with ``OLLAMA_NUM_PARALLEL`` >=
+    ``concurrency``.
+
+    Args:
+        pdf_paths: Paths to the PDF files.
+        use_llm: Whether to use LLM for advanced metadata extraction.
+        model: Ollama model name to use for LLM extraction.
+        language: Output language for all extracted fields (None = auto-detect).
+        concurrency: Maximum number of files processed at the same time.
+        debug: Whether to print debug information to stderr.
+        cache_dir: Directory for cached LLM responses (None = no caching).
+        max_tokens: Approximate token budget for the text sent to the LLM
+            (None = no limit).
+        pdf_workers: Number of processes for extracting text from long PDFs.
+
+    Yields:
+        ``(path, result)`` tuples in completion order, where ``result`` is the
+        PDFMetadata, or the exception raised while processing that file
+        (typically FileNotFoundError, ValueError or ConnectionError, but any
+        exception is reported this way instead of aborting the batch).
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    pdf_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-parser")
+
+    async def process(
+        pdf_path: Path, client: ollama.AsyncClient,
+    ) -> tuple[Path, PDFMetadata | Exception]:
+        async with semaphore:
+            try:
+                file_properties, text = await loop.run_in_executor(
+                    pdf_executor, _extract_pdf, pdf_path, use_llm, pdf_workers, debug,
+                )
+                llm_metadata = None
+                if text and text.strip():
+                    llm_metadata = await aextract_llm_metadata(
+                        text, model=model, language=language, debug=debug,
+                        cache_dir=cache_dir, max_tokens=max_tokens, client=client,
+                    )
+            except Exception as e:
+                # Report the failure for this file only; the others keep going
+                return pdf_path, e
+            return pdf_path, PDFMetadata(file=file_properties, llm=llm_metadata)
+
+    async with async_client() as client:
+        tasks = [asyncio.ensure_future(process(Path(p), client)) for p in pdf_paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled tasks finish before their client is closed
+            await asyncio.gather(*tasks, return_exceptions=True)
+            pdf_executor.shutdown(wait=False, cancel_futures=True)
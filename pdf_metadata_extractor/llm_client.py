@@ -1,11 +1,43 @@
 """Ollama API client for LLM-based metadata extraction."""
 
+import hashlib
 import json
+import os
+import sys
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
 
 import ollama
+import orjson
 
 from .models import LLMMetadata, LLMStats
 
+try:
+    import tiktoken
+except ImportError:  # optional: fall back to a character-based estimate
+    tiktoken = None
+
+
+# Keep the model (and its KV cache for the shared system + few-shot prefix)
+# loaded between requests instead of Ollama's default of 5 minutes.
+KEEP_ALIVE = "30m"
+
+# Shared client so that the HTTP connection to Ollama is kept alive between
+# requests. httpx async connection pools are bound to an event loop, so async
+# callers get their own client from async_client() instead.
+_CLIENT = ollama.Client()
+
+# Token budget for the document text. Ollama's default context is 4096 tokens;
+# the system prompt + few-shot example take ~400 and the JSON answer needs room.
+DEFAULT_MAX_TOKENS = 3000
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "pdf_metadata_extractor"
+
 
 SYSTEM_PROMPT_AUTO = """Extract bibliographic metadata from the given document text.
 Write all output values in the same language as the document.
@@ -59,70 +91,206 @@ JSON_SCHEMA = {
     ],
 }
 
+# Sampling options for extraction requests
+CHAT_OPTIONS = {"temperature": 0.3}
 
-def extract_llm_metadata(
-    text: str, model: str = "llama3.2", language: str | None = None, debug: bool = False,
-) -> LLMMetadata:
-    """Extract metadata from text using LLM.
+# Bump when the way responses are turned into LLMMetadata changes, so that
+# existing cache entries are no longer used.
+_CACHE_VERSION = 1
 
-    Args:
-        text: Document text to analyze.
-        model: Ollama model name to use.
-        debug: Whether to print debug information to stderr.
+# Everything besides the model, system prompt and document text that affects
+# the response; part of every cache key.
+_CACHE_FINGERPRINT = orjson.dumps(
+    [_CACHE_VERSION, FEW_SHOT_USER, FEW_SHOT_ASSISTANT, JSON_SCHEMA, CHAT_OPTIONS],
+    option=orjson.OPT_SORT_KEYS,
+)
 
-    Returns:
-        LLMMetadata object with extracted information.
 
-    Raises:
-        ConnectionError: If Ollama server is not available.
-        ValueError: If LLM response cannot be parsed.
+@asynccontextmanager
+async def async_client() -> AsyncIterator[ollama.AsyncClient]:
+    """Yield an AsyncClient for the running event loop and close it on exit."""
+    client = ollama.AsyncClient()
+    try:
+        yield client
+    finally:
+        close = getattr(client, "close", None)
+        if close is not None:
+            await close()
+        else:
+            # Older ollama releases have no AsyncClient.close()
+            await client._client.aclose()
+
+
+@lru_cache(maxsize=1)
+def _tiktoken_encoding():
+    """Return tiktoken's cl100k_base encoding, or None if it is unavailable.
+
+    The encoding is loaded once. Loading may need to download the BPE file, so
+    any failure (not installed, offline, ...) falls back to the estimate.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to approximately ``max_tokens`` LLM tokens.
+
+    Uses tiktoken's cl100k_base encoding when available. Otherwise estimates
+    ~4 characters per token for ASCII and UTF-8 bytes / 3.5 for other
+    characters (CJK text is close to one token per character).
     """
+    encoding = _tiktoken_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        # A cut inside a multi-byte character would decode to U+FFFD
+        return encoding.decode(tokens[:max_tokens], errors="ignore")
+
+    # Quick exit: every character costs at most 4 bytes / 3.5 tokens
+    if len(text) * 4 / 3.5 <= max_tokens:
+        return text
+
+    estimated = 0.0
+    for i, char in enumerate(text):
+        estimated += 0.25 if char < "\x80" else len(char.encode("utf-8")) / 3.5
+        if estimated > max_tokens:
+            return text[:i]
+    return text
+
+
+def _normalize_language(language: str | None) -> str | None:
+    """Normalize an output language; "", " English" etc. map to None / "English"."""
+    return (language.strip() or None) if language else None
+
+
+def _system_prompt(language: str | None) -> str:
+    """Return the system prompt for an output language (None = auto-detect)."""
+    if language is None:
+        return SYSTEM_PROMPT_AUTO
+    return SYSTEM_PROMPT_LANG.format(language=language)
+
+
+@lru_cache(maxsize=32)
+def _prefix_messages(language: str | None) -> tuple[dict, ...]:
+    """Return the system prompt and few-shot example messages.
+
+    Cached so that every request for the same language sends the exact same
+    prefix, which is what Ollama's prompt prefix cache matches on. The dicts
+    are shared between calls and must not be modified.
+    """
+    return (
+        {"role": "system", "content": _system_prompt(language)},
+        {"role": "user", "content": FEW_SHOT_USER},
+        {"role": "assistant", "content": FEW_SHOT_ASSISTANT},
+    )
+
+
+def _build_messages(text: str, language: str | None) -> list[dict]:
+    """Build the chat messages (system prompt, few-shot example, document text)."""
+    return [*_prefix_messages(_normalize_language(language)), {"role": "user", "content": text}]
+
+
+def _prepare_messages(
+    text: str, model: str, language: str | None, max_tokens: int | None, debug: bool,
+) -> list[dict]:
+    """Validate and truncate the document text, then build the chat messages."""
     if not text.strip():
         raise ValueError("Empty text provided for LLM analysis")
 
-    if language:
-        system_prompt = SYSTEM_PROMPT_LANG.format(language=language)
-    else:
-        system_prompt = SYSTEM_PROMPT_AUTO
+    if max_tokens is not None:
+        original_length = len(text)
+        text = _truncate_to_tokens(text, max_tokens)
+        if debug and len(text) < original_length:
+            print(
+                f"[DEBUG] Truncated input from {original_length} to {len(text)} chars "
+                f"(max {max_tokens} tokens)",
+                file=sys.stderr,
+            )
 
+    language = _normalize_language(language)
+    messages = _build_messages(text, language)
     if debug:
-        import sys
-        print(f"[DEBUG] Model: {model}", file=sys.stderr)
-        print(f"[DEBUG] Output language: {language or 'auto'}", file=sys.stderr)
-        print(f"[DEBUG] System prompt: {system_prompt}", file=sys.stderr)
-        print(f"[DEBUG] Few-shot example included: yes", file=sys.stderr)
-        print(f"[DEBUG] Input text length: {len(text)} chars", file=sys.stderr)
-        print(f"[DEBUG] Input text (first 500 chars):", file=sys.stderr)
-        print(text[:500], file=sys.stderr)
-        print("---", file=sys.stderr)
+        _debug_request(messages, text, model, language)
+    return messages
+
+
+def _debug_request(messages: list[dict], text: str, model: str, language: str | None) -> None:
+    """Print the request details to stderr."""
+    print(f"[DEBUG] Model: {model}", file=sys.stderr)
+    print(f"[DEBUG] Output language: {language or 'auto'}", file=sys.stderr)
+    print(f"[DEBUG] System prompt: {messages[0]['content']}", file=sys.stderr)
+    print(f"[DEBUG] Few-shot example included: yes", file=sys.stderr)
+    print(f"[DEBUG] Input text length: {len(text)} chars", file=sys.stderr)
+    print(f"[DEBUG] Input text (first 500 chars):", file=sys.stderr)
+    print(text[:500], file=sys.stderr)
+    print("---", file=sys.stderr)
+
+
+def _cache_path(cache_dir: Path, model: str, messages: list[dict]) -> Path:
+    """Return the cache file for a request.
 
+    The key covers the model, system prompt and text as well as the few-shot
+    example, JSON schema and sampling options (see _CACHE_FINGERPRINT).
+    """
+    key = hashlib.blake2b(_CACHE_FINGERPRINT, digest_size=16)
+    key.update("|".join((model, messages[0]["content"], messages[-1]["content"])).encode())
+    key = key.hexdigest()
+    return Path(cache_dir) / f"{key}.json"
+
+
+def _read_cache(path: Path, debug: bool) -> LLMMetadata | None:
+    """Load cached metadata, or None if there is no usable cache entry."""
     try:
-        response = ollama.chat(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": FEW_SHOT_USER},
-                {"role": "assistant", "content": FEW_SHOT_ASSISTANT},
-                {"role": "user", "content": text},
-            ],
-            format=JSON_SCHEMA,
-            options={
-                "temperature": 0.3,
-            },
-        )
-    except ollama.ResponseError as e:
+        metadata = LLMMetadata.model_validate_json(path.read_bytes())
+    except (OSError, ValueError):  # ValidationError is a ValueError
+        return None
+
+    if debug:
+        print(f"[DEBUG] LLM cache hit: {path}", file=sys.stderr)
+    return metadata
+
+
+def _write_cache(path: Path, metadata: LLMMetadata) -> None:
+    """Atomically store metadata (without stats) in the cache; failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(metadata.model_dump_json(exclude={"stats"}))
+        os.replace(tmp_name, path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def _translate_error(e: Exception, model: str) -> Exception:
+    """Map an Ollama client error to ConnectionError, or return it unchanged."""
+    if isinstance(e, ollama.ResponseError):
         if "not found" in str(e).lower():
-            raise ConnectionError(
+            return ConnectionError(
                 f"Model '{model}' not found. Please run: ollama pull {model}"
-            ) from e
-        raise ConnectionError(f"Ollama API error: {e}") from e
-    except Exception as e:
-        if "connection" in str(e).lower() or "refused" in str(e).lower():
-            raise ConnectionError(
-                "Cannot connect to Ollama. Please ensure Ollama is running: ollama serve"
-            ) from e
-        raise
+            )
+        return ConnectionError(f"Ollama API error: {e}")
+    if "connection" in str(e).lower() or "refused" in str(e).lower():
+        return ConnectionError(
+            "Cannot connect to Ollama. Please ensure Ollama is running: ollama serve"
+        )
+    return e
 
+
+def _parse_response(response: ollama.ChatResponse, model: str, debug: bool) -> LLMMetadata:
+    """Convert an Ollama chat response into LLMMetadata."""
     response_text = response.message.content or ""
 
     # Extract LLM performance statistics
@@ -160,21 +328,19 @@ def extract_llm_metadata(
     )
 
     if debug:
-        import sys
         print(f"\n[DEBUG] Raw LLM response:", file=sys.stderr)
         print(response_text, file=sys.stderr)
         print("---", file=sys.stderr)
-        print(f"[DEBUG] LLM Stats: {llm_stats.model_dump_json(indent=2)}", file=sys.stderr)
+        print(f"[DEBUG] LLM Stats: {orjson.dumps(llm_stats, option=orjson.OPT_INDENT_2).decode()}", file=sys.stderr)
 
     try:
-        data = json.loads(response_text)
-    except json.JSONDecodeError as e:
+        data = orjson.loads(response_text)
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in LLM response: {e}") from e
 
     if debug:
-        import sys
         print(f"\n[DEBUG] Parsed JSON keys: {list(data.keys())}", file=sys.stderr)
-        print(f"[DEBUG] Parsed JSON: {json.dumps(data, ensure_ascii=False, indent=2)}", file=sys.stderr)
+        print(f"[DEBUG] Parsed JSON: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}", file=sys.stderr)
 
     keywords = data.get("keywords", [])
     if isinstance(keywords, str):
@@ -195,3 +361,138 @@ def extract_llm_metadata(
         language=data.get("language", "Unknown"),
         stats=llm_stats,
     )
+
+
+def warmup_model(model: str = "llama3.2", language: str | None = None, debug: bool = False) -> None:
+    """Load the model and prefill the shared system + few-shot prompt prefix.
+
+    Sends the same leading messages as extract_llm_metadata() with a tiny
+    document and a one-token output, so that the following real requests can
+    reuse the prefix from Ollama's KV cache.
+
+    Raises:
+        ConnectionError: If Ollama server is not available.
+    """
+    messages = _build_messages(".", language)
+
+    if debug:
+        print(f"[DEBUG] Warming up model: {model}", file=sys.stderr)
+
+    try:
+        _CLIENT.chat(
+            model=model,
+            messages=messages,
+            options={**CHAT_OPTIONS, "num_predict": 1},
+            keep_alive=KEEP_ALIVE,
+        )
+    except Exception as e:
+        error = _translate_error(e, model)
+        if error is e:
+            raise
+        raise error from e
+
+
+def extract_llm_metadata(
+    text: str, model: str = "llama3.2", language: str | None = None, debug: bool = False,
+    cache_dir: str | Path | None = None,
+    max_tokens: int | None = DEFAULT_MAX_TOKENS,
+) -> LLMMetadata:
+    """Extract metadata from text using LLM.
+
+    Args:
+        text: Document text to analyze.
+        model: Ollama model name to use.
+        language: Output language for all extracted fields (None = auto-detect).
+        debug: Whether to print debug information to stderr.
+        cache_dir: Directory for cached LLM responses (None = no caching).
+            On a cache hit Ollama is not called and ``stats`` is None.
+        max_tokens: Approximate token budget for ``text``; longer text is
+            truncated before sending (None = no limit).
+
+    Returns:
+        LLMMetadata object with extracted information.
+
+    Raises:
+        ConnectionError: If Ollama server is not available.
+        ValueError: If LLM response cannot be parsed.
+    """
+    messages = _prepare_messages(text, model, language, max_tokens, debug)
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _cache_path(cache_dir, model, messages)
+        cached = _read_cache(cache_path, debug)
+        if cached is not None:
+            return cached
+
+    try:
+        response = _CLIENT.chat(
+            model=model,
+            messages=messages,
+            format=JSON_SCHEMA,
+            options=CHAT_OPTIONS,
+            keep_alive=KEEP_ALIVE,
+        )
+    except Exception as e:
+        error = _translate_error(e, model)
+        if error is e:
+            raise
+        raise error from e
+
+    metadata = _parse_response(response, model, debug)
+    if cache_path is not None:
+        _write_cache(cache_path, metadata)
+    return metadata
+
+
+async def aextract_llm_metadata(
+    text: str, model: str = "llama3.2", language: str | None = None, debug: bool = False,
+    cache_dir: str | Path | None = None,
+    max_tokens: int | None = DEFAULT_MAX_TOKENS,
+    client: ollama.AsyncClient | None = None,
+) -> LLMMetadata:
+    """Extract metadata from text using LLM without blocking the event loop.
+
+    Same as extract_llm_metadata() but uses an ollama.AsyncClient, so several
+    requests can be in flight at once (see extractor.extract_metadata_batch).
+    Pass ``client`` (from async_client()) to share one connection pool across
+    requests; otherwise a client is created and closed for this call.
+
+    Raises:
+        ConnectionError: If Ollama server is not available.
+        ValueError: If LLM response cannot be parsed.
+    """
+    if client is None:
+        async with async_client() as client:
+            return await aextract_llm_metadata(
+                text, model=model, language=language, debug=debug,
+                cache_dir=cache_dir, max_tokens=max_tokens, client=client,
+            )
+
+    messages = _prepare_messages(text, model, language, max_tokens, debug)
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _cache_path(cache_dir, model, messages)
+        cached = _read_cache(cache_path, debug)
+        if cached is not None:
+            return cached
+
+    try:
+        response = await client.chat(
+            model=model,
+            messages=messages,
+            format=JSON_SCHEMA,
+            options=CHAT_OPTIONS,
+            keep_alive=KEEP_ALIVE,
+        )
+    except Exception as e:
+        error = _translate_error(e, model)
+        if error is e:
+            raise
+        raise error from e
+
+    metadata = _parse_response(response, model, debug)
+    if cache_path is not None:
+        _write_cache(cache_path, metadata)
+    return metadata
@@ -1,10 +1,18 @@
-"""Pydantic data models for PDF metadata."""
+"""Data models for PDF metadata.
 
+FileProperties and LLMStats are built from values we already computed, so
+they are plain slotted dataclasses (no validation cost). LLMMetadata and
+PDFMetadata are Pydantic models: they validate LLM output and cached JSON,
+and provide serialization for the whole result.
+"""
+
+from dataclasses import dataclass
 from datetime import datetime
 from pydantic import BaseModel
 
 
-class FileProperties(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FileProperties:
     """Physical properties of the PDF file."""
 
     page_count: int
@@ -14,7 +22,8 @@ class FileProperties(BaseModel):
     modified_at: datetime | None = None
 
 
-class LLMStats(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LLMStats:
     """LLM performance statistics."""
 
     model: str
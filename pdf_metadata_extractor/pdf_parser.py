@@ -1,7 +1,16 @@
 """PDF parsing and text extraction using PyMuPDF."""
 
+import math
+import multiprocessing
 import os
-from datetime import datetime
+import re
+import threading
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
 
 import fitz  # PyMuPDF
@@ -9,40 +18,287 @@ import fitz  # PyMuPDF
 from .models import FileProperties
 
 
+# Pages per task sent to a worker process; documents with fewer than this
+# many pages per worker are read sequentially
+_PAGES_PER_CHUNK = 4
+
+# Worker pools for parallel text extraction, keyed by worker count. They are
+# created on first use and reused, so process start-up is paid once per run.
+_PROCESS_POOLS: dict[int, ProcessPoolExecutor] = {}
+_PROCESS_POOLS_LOCK = threading.Lock()
+
+# Lines found on at least this fraction of pages are treated as running
+# headers/footers
+_BOILERPLATE_PAGE_RATIO = 0.3
+
+# Bare page numbers ("12", "- 12 -") and "Page N of M"
+_PAGE_NUMBER_RE = re.compile(
+    r"\s*(?:(?:[-–—]\s*)?\d+(?:\s*[-–—])?|Page\s+\d+\s+of\s+\d+)\s*", re.IGNORECASE,
+)
+
+
+# D:YYYYMMDDHHmmSSOHH'mm' -- everything after the year is optional, but a UTC
+# offset is only accepted after a full HHmmSS time
+_PDF_DATE_RE = re.compile(
+    r"(?:D:)?(\d{4})(?:(\d{2})(?:(\d{2})(?:(\d{2})(?:(\d{2})(?:(\d{2})"
+    r"(?:([+\-Z])(?:(\d{2})(?:'?(\d{2}))?'?)?)?"
+    r")?)?)?)?)?"
+)
+
+
 def parse_pdf_date(date_str: str | None) -> datetime | None:
     """Parse PDF date string to datetime object.
 
     PDF dates are typically in format: D:YYYYMMDDHHmmSS+HH'mm'
+    The result is timezone-aware when the string carries a UTC offset.
+    Strings in any other format return None.
     """
     if not date_str:
         return None
 
-    # Remove 'D:' prefix if present
-    if date_str.startswith("D:"):
-        date_str = date_str[2:]
+    match = _PDF_DATE_RE.fullmatch(date_str.strip())
+    if not match:
+        return None
+
+    year, month, day, hour, minute, second, sign, tz_hour, tz_minute = match.groups()
+
+    try:
+        tzinfo = None
+        if sign == "Z":
+            tzinfo = timezone.utc
+        elif sign:
+            if int(tz_minute or 0) >= 60:
+                return None
+            offset = timedelta(hours=int(tz_hour or 0), minutes=int(tz_minute or 0))
+            tzinfo = timezone(-offset if sign == "-" else offset)
+
+        return datetime(
+            int(year), int(month or 1), int(day or 1),
+            int(hour or 0), int(minute or 0), int(second or 0),
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        # Out-of-range field (e.g. month 13) or offset of 24h or more
+        return None
+
+
+def _open_pdf(pdf_path: Path) -> tuple[fitz.Document, os.stat_result]:
+    """Stat and open a PDF file, raising FileNotFoundError / ValueError on failure."""
+    try:
+        stat = os.stat(pdf_path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}") from e
+    except OSError as e:
+        raise ValueError(f"Cannot access PDF file: {e}") from e
+
+    try:
+        return fitz.open(pdf_path), stat
+    except Exception as e:
+        raise ValueError(f"Failed to open PDF: {e}") from e
+
+
+def _read_file_properties(doc: fitz.Document, stat: os.stat_result) -> FileProperties:
+    """Read file properties from an open document and its stat result.
+
+    The file's mtime is used when the PDF has no modification date.
+    """
+    metadata = doc.metadata or {}
+
+    pdf_version = None
+    try:
+        if doc.xref_length() > 0:
+            pdf_version = f"{doc.metadata.get('format', 'PDF')}"
+            if pdf_version == "PDF":
+                pdf_version = None
+    except Exception:
+        pass
+
+    modified_at = parse_pdf_date(metadata.get("modDate"))
+    if modified_at is None:
+        modified_at = datetime.fromtimestamp(int(stat.st_mtime)).astimezone()
+
+    return FileProperties(
+        page_count=doc.page_count,
+        file_size=stat.st_size,
+        pdf_version=pdf_version,
+        created_at=parse_pdf_date(metadata.get("creationDate")),
+        modified_at=modified_at,
+    )
+
+
+def _page_text(page: fitz.Page) -> str:
+    """Return the text blocks of a page in reading order."""
+    # (x0, y0, x1, y1, text, block_no, block_type); type 0 is text
+    return "".join(
+        block[4] for block in page.get_text("blocks", sort=True) if block[6] == 0
+    )
+
+
+def _read_page_range(pdf_path: Path, start: int, stop: int) -> list[str]:
+    """Read the text of pages [start, stop) in a worker process."""
+    with fitz.open(pdf_path) as doc:
+        return [_page_text(doc[page_num]) for page_num in range(start, stop)]
+
+
+def _join_pages(page_texts: Iterable[str], max_chars: int) -> str:
+    """Join page texts, consuming only as many pages as fit in ``max_chars``."""
+    text_parts = []
+    total_chars = 0
+
+    for page_text in page_texts:
+        if total_chars + len(page_text) >= max_chars:
+            text_parts.append(page_text[: max_chars - total_chars])
+            break
+        text_parts.append(page_text)
+        total_chars += len(page_text)
+
+    return "\n\n".join(text_parts)
+
 
-    # Try common formats
-    formats = [
-        "%Y%m%d%H%M%S",
-        "%Y%m%d%H%M%S%z",
-        "%Y%m%d",
+def _strip_page_lines(lines: list[str], repeated: set[str]) -> str:
+    """Join a page's lines without running headers/footers and page numbers.
+
+    Bare numbers are only treated as page numbers when they are the first or
+    last line left after removing headers/footers; elsewhere they may be
+    content (a year, a table cell).
+    """
+    lines = [line for line in lines if line.strip() not in repeated]
+    non_blank = [i for i, line in enumerate(lines) if line.strip()]
+    edges = {non_blank[0], non_blank[-1]} if non_blank else set()
+    return "\n".join(
+        line for i, line in enumerate(lines)
+        if not (i in edges and _PAGE_NUMBER_RE.fullmatch(line))
+    )
+
+
+def _strip_boilerplate(pages: list[list[str]]) -> list[str]:
+    """Remove page numbers and running headers/footers from page lines.
+
+    A line is a running header/footer if it appears on at least 30% of the
+    pages (and on at least two). The first page is left unchanged: repeated
+    lines there are often the title or journal name, and a bare number is
+    more likely a year or volume than a page number.
+    """
+    counts = Counter(
+        line for lines in pages for line in {line.strip() for line in lines} if line
+    )
+    threshold = max(2, math.ceil(_BOILERPLATE_PAGE_RATIO * len(pages)))
+    repeated = {line for line, count in counts.items() if count >= threshold}
+
+    return [
+        "\n".join(lines) if page_num == 0 else _strip_page_lines(lines, repeated)
+        for page_num, lines in enumerate(pages)
     ]
 
-    # Clean up timezone info
-    date_str = date_str.replace("'", "").replace("Z", "+0000")
-    # Handle +HH'mm' format -> +HHmm
-    if "+" in date_str:
-        parts = date_str.split("+")
-        if len(parts) == 2:
-            date_str = parts[0][:14]  # Take only the date part
 
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str[: len(fmt.replace("%", ""))], fmt)
-        except (ValueError, IndexError):
-            continue
+def _collect_text(page_texts: Iterable[str], max_chars: int, strip_boilerplate: bool) -> str:
+    """Join page texts up to ``max_chars``, optionally removing boilerplate first.
+
+    Boilerplate depends on all pages read so far, so pages are consumed until
+    the *cleaned* text fills ``max_chars``.
+    """
+    if not strip_boilerplate:
+        return _join_pages(page_texts, max_chars)
+
+    pages = []
+    raw_chars = 0
+    for page_text in page_texts:
+        pages.append(page_text.splitlines())
+        raw_chars += len(page_text)
+        if raw_chars >= max_chars:
+            cleaned = _strip_boilerplate(pages)
+            if sum(map(len, cleaned)) >= max_chars:
+                return _join_pages(cleaned, max_chars)
+
+    return _join_pages(_strip_boilerplate(pages), max_chars)
+
 
-    return None
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool with ``workers`` processes.
+
+    Workers are started with "spawn": extraction may run in a thread of a
+    process with an event loop (batch mode), where forking is unsafe.
+    """
+    with _PROCESS_POOLS_LOCK:
+        pool = _PROCESS_POOLS.get(workers)
+        if pool is None:
+            pool = _PROCESS_POOLS[workers] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+        return pool
+
+
+def _discard_process_pool(workers: int, pool: ProcessPoolExecutor) -> None:
+    """Forget a broken worker pool so that the next call starts a new one."""
+    with _PROCESS_POOLS_LOCK:
+        if _PROCESS_POOLS.get(workers) is pool:
+            del _PROCESS_POOLS[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_parallel_pages(
+    executor: Executor, pdf_path: Path, page_count: int, workers: int,
+) -> Iterator[str]:
+    """Yield page texts in order, keeping at most ``workers`` chunks in flight.
+
+    Chunks are submitted lazily, so when the consumer stops early (max_chars
+    reached) the remaining pages are never read.
+    """
+    ranges = (
+        (start, min(start + _PAGES_PER_CHUNK, page_count))
+        for start in range(0, page_count, _PAGES_PER_CHUNK)
+    )
+    pending = deque(
+        executor.submit(_read_page_range, pdf_path, start, stop)
+        for start, stop in islice(ranges, workers)
+    )
+
+    try:
+        while pending:
+            pages = pending.popleft().result()
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(executor.submit(_read_page_range, pdf_path, *next_range))
+            yield from pages
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _read_text(
+    doc: fitz.Document,
+    pdf_path: Path,
+    max_pages: int,
+    max_chars: int,
+    workers: int,
+    strip_boilerplate: bool,
+) -> str:
+    """Read text from an open document, stopping at ``max_chars``.
+
+    With ``workers`` > 1, long documents are read in chunks of pages by a
+    shared pool of worker processes (PyMuPDF does not support multithreading),
+    each of which opens its own copy of the file. If a worker process dies,
+    ValueError is raised and the next call starts a new pool.
+    """
+    page_count = min(max_pages, doc.page_count)
+    workers = min(workers, page_count // _PAGES_PER_CHUNK)
+
+    if workers <= 1:
+        page_texts = (_page_text(doc[i]) for i in range(page_count))
+        return _collect_text(page_texts, max_chars, strip_boilerplate)
+
+    pool = _process_pool(workers)
+    page_texts = _iter_parallel_pages(pool, pdf_path, page_count, workers)
+    try:
+        return _collect_text(page_texts, max_chars, strip_boilerplate)
+    except BrokenProcessPool as e:
+        # A worker died (e.g. MuPDF crashed on a malformed file); the pool
+        # cannot be used again
+        _discard_process_pool(workers, pool)
+        raise ValueError(f"Failed to extract text: {e}") from e
+    finally:
+        # Cancel chunks that were submitted but are no longer needed
+        page_texts.close()
 
 
 def extract_file_properties(pdf_path: str | Path) -> FileProperties:
@@ -58,71 +314,79 @@ def extract_file_properties(pdf_path: str | Path) -> FileProperties:
         FileNotFoundError: If the PDF file does not exist.
         ValueError: If the file is not a valid PDF.
     """
-    pdf_path = Path(pdf_path)
-
-    if not pdf_path.exists():
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
-    file_size = os.path.getsize(pdf_path)
-
-    try:
-        doc = fitz.open(pdf_path)
-    except Exception as e:
-        raise ValueError(f"Failed to open PDF: {e}") from e
+    file_properties, _ = extract_all(pdf_path, need_text=False)
+    return file_properties
 
-    try:
-        metadata = doc.metadata or {}
-
-        pdf_version = None
-        try:
-            if doc.xref_length() > 0:
-                pdf_version = f"{doc.metadata.get('format', 'PDF')}"
-                if pdf_version == "PDF":
-                    pdf_version = None
-        except Exception:
-            pass
-
-        return FileProperties(
-            page_count=doc.page_count,
-            file_size=file_size,
-            pdf_version=pdf_version,
-            created_at=parse_pdf_date(metadata.get("creationDate")),
-            modified_at=parse_pdf_date(metadata.get("modDate")),
-        )
-    finally:
-        doc.close()
 
-
-def extract_text(pdf_path: str | Path, max_pages: int = 50, max_chars: int = 50000) -> str:
+def extract_text(
+    pdf_path: str | Path,
+    max_pages: int = 50,
+    max_chars: int = 50000,
+    workers: int = 1,
+    strip_boilerplate: bool = True,
+) -> str:
     """Extract text from PDF for LLM analysis.
 
+    Text is read page by page as sorted text blocks (in reading order) and
+    extraction stops as soon as ``max_chars`` is reached, so later pages are
+    never touched. Page numbers and running headers/footers are removed
+    before the limit is applied.
+
     Args:
         pdf_path: Path to the PDF file.
         max_pages: Maximum number of pages to extract (default: 50).
         max_chars: Maximum number of characters to return (default: 50000).
+        workers: Number of processes for extracting long documents (default: 1).
+        strip_boilerplate: Remove page numbers and running headers/footers
+            (default: True).
 
     Returns:
         Extracted text content.
+
+    Raises:
+        FileNotFoundError: If the PDF file does not exist.
+        ValueError: If the file is not a valid PDF.
     """
     pdf_path = Path(pdf_path)
 
-    doc = fitz.open(pdf_path)
-    try:
-        text_parts = []
-        total_chars = 0
+    doc, _ = _open_pdf(pdf_path)
+    with doc:
+        return _read_text(doc, pdf_path, max_pages, max_chars, workers, strip_boilerplate)
 
-        for page_num in range(min(max_pages, doc.page_count)):
-            page = doc[page_num]
-            page_text = page.get_text(sort=True)
 
-            if total_chars + len(page_text) > max_chars:
-                remaining = max_chars - total_chars
-                text_parts.append(page_text[:remaining])
-                break
+def extract_all(
+    pdf_path: str | Path,
+    need_text: bool = True,
+    max_pages: int = 50,
+    max_chars: int = 50000,
+    workers: int = 1,
+    strip_boilerplate: bool = True,
+) -> tuple[FileProperties, str | None]:
+    """Extract file properties and (optionally) text, opening the PDF only once.
 
-            text_parts.append(page_text)
-            total_chars += len(page_text)
+    Args:
+        pdf_path: Path to the PDF file.
+        need_text: Whether to extract text as well (default: True).
+        max_pages: Maximum number of pages to extract (default: 50).
+        max_chars: Maximum number of characters to return (default: 50000).
+        workers: Number of processes for extracting long documents (default: 1).
+        strip_boilerplate: Remove page numbers and running headers/footers
+            (default: True).
 
-        return "\n\n".join(text_parts)
-    finally:
-        doc.close()
+    Returns:
+        Tuple of FileProperties and the extracted text (None if not requested).
+
+    Raises:
+        FileNotFoundError: If the PDF file does not exist.
+        ValueError: If the file is not a valid PDF.
+    """
+    pdf_path = Path(pdf_path)
+
+    doc, stat = _open_pdf(pdf_path)
+    with doc:
+        file_properties = _read_file_properties(doc, stat)
+        text = None
+        if need_text:
+            text = _read_text(doc, pdf_path, max_pages, max_chars, workers, strip_boilerplate)
+
+    return file_properties, text